@@ -37,6 +37,20 @@ check_docker_version() {
     fi
 }
 
+# Function to share a single SSH connection between all calls to the cluster
+# A master connection is opened in the foreground, so that any password or OTP prompt is answered before other
+# work starts. It is reused by all subsequent ssh and rsync calls instead of authenticating again, and is closed
+# when the script exits.
+setup_ssh_connection() {
+    ssh_control_path="/tmp/isaaclab-ssh-$$.sock"
+    SSH_OPTS="-o ControlMaster=auto -o ControlPath=$ssh_control_path -o ControlPersist=yes"
+    if ! ssh $SSH_OPTS -fN "$CLUSTER_LOGIN"; then
+        echo "[Error] Could not connect to the remote host $CLUSTER_LOGIN!" >&2;
+        exit 1
+    fi
+    trap 'ssh -O exit -o ControlPath="$ssh_control_path" "$CLUSTER_LOGIN" &> /dev/null || true' EXIT
+}
+
 # Checks if a docker image exists, otherwise prints warning and exists
 check_image_exists() {
     image_name="$1"
@@ -48,11 +62,22 @@ check_image_exists() {
 }
 
 # Check if the singularity image exists on the remote host, otherwise print warning and exit
+# If a directory is passed as second argument, it is created on the remote host within the same SSH call
 check_singularity_image_exists() {
     image_name="$1"
-    if ! ssh "$CLUSTER_LOGIN" "[ -f $CLUSTER_SIF_PATH/$image_name.tar ]"; then
+    remote_dir="${2:-.}"
+    # the remote command exits with a distinct code for each failure
+    ssh $SSH_OPTS "$CLUSTER_LOGIN" "[ -f $CLUSTER_SIF_PATH/$image_name.tar ] || exit 3; mkdir -p $remote_dir || exit 4" \
+        && status=0 || status=$?
+    if [ $status -eq 3 ]; then
         echo "[Error] The '$image_name' image does not exist on the remote host $CLUSTER_LOGIN!" >&2;
         exit 1
+    elif [ $status -eq 4 ]; then
+        echo "[Error] Could not create the directory '$remote_dir' on the remote host $CLUSTER_LOGIN!" >&2;
+        exit 1
+    elif [ $status -ne 0 ]; then
+        echo "[Error] Could not check for the '$image_name' image on the remote host $CLUSTER_LOGIN!" >&2;
+        exit 1
     fi
 }
 
@@ -75,7 +100,7 @@ submit_job() {
             ;;
     esac
 
-    ssh $CLUSTER_LOGIN "cd $CLUSTER_ISAACLAB_DIR && $CMD $CLUSTER_ISAACLAB_DIR/docker/cluster/$job_script_file \"$CLUSTER_ISAACLAB_DIR\" \"isaac-lab-$profile\" ${@}"
+    ssh $SSH_OPTS $CLUSTER_LOGIN "cd $CLUSTER_ISAACLAB_DIR && $CMD $CLUSTER_ISAACLAB_DIR/docker/cluster/$job_script_file \"$CLUSTER_ISAACLAB_DIR\" \"isaac-lab-$profile\" ${@}"
 }
 
 #==
@@ -145,21 +170,45 @@ case $command in
         check_docker_version
         # source env file to get cluster login and path information
         source $SCRIPT_DIR/.env.cluster
+        # share a single SSH connection for all calls to the cluster
+        setup_ssh_connection
+        # make sure target directory exists on the cluster
+        # NOTE: this runs in the background over the already open SSH connection, as it only depends on the remote
+        #   host and can overlap with the local image build below
+        ssh $SSH_OPTS $CLUSTER_LOGIN "mkdir -p $CLUSTER_SIF_PATH" &
+        remote_mkdir_pid=$!
         # make sure exports directory exists
-        mkdir -p /$SCRIPT_DIR/exports
+        mkdir -p $SCRIPT_DIR/exports
         # clear old exports for selected profile
-        rm -rf /$SCRIPT_DIR/exports/isaac-lab-$profile*
+        # NOTE: the old sandbox contains many files, so it is moved aside and removed in the background while the
+        #   new image is built. Leftovers of previously interrupted removals are cleared along with it.
+        stale_exports_dir=$(mktemp -d $SCRIPT_DIR/exports/.stale.XXXXXX)
+        mv $SCRIPT_DIR/exports/isaac-lab-$profile* $stale_exports_dir/ 2> /dev/null || true
+        for leftover_dir in $SCRIPT_DIR/exports/.stale.*; do
+            if [ "$leftover_dir" != "$stale_exports_dir" ]; then
+                mv "$leftover_dir" $stale_exports_dir/
+            fi
+        done
+        rm -rf $stale_exports_dir &
+        remove_stale_pid=$!
         # create singularity image
         # NOTE: we create the singularity image as non-root user to allow for more flexibility. If this causes
         # issues, remove the --fakeroot flag and open an issue on the IsaacLab repository.
-        cd /$SCRIPT_DIR/exports
-        APPTAINER_NOHTTPS=1 apptainer build --sandbox --fakeroot isaac-lab-$profile.sif docker-daemon://isaac-lab-$profile:latest
+        APPTAINER_NOHTTPS=1 apptainer build --sandbox --fakeroot $SCRIPT_DIR/exports/isaac-lab-$profile.sif docker-daemon://isaac-lab-$profile:latest
+        # wait for the old exports to be removed
+        wait $remove_stale_pid
         # tar image (faster to send single file as opposed to directory with many files)
-        tar -cvf /$SCRIPT_DIR/exports/isaac-lab-$profile.tar isaac-lab-$profile.sif
-        # make sure target directory exists
-        ssh $CLUSTER_LOGIN "mkdir -p $CLUSTER_SIF_PATH"
-        # send image to cluster
-        scp $SCRIPT_DIR/exports/isaac-lab-$profile.tar $CLUSTER_LOGIN:$CLUSTER_SIF_PATH/isaac-lab-$profile.tar
+        # NOTE: the sandbox contains a large number of files, so the archive is created without listing them
+        tar -cf $SCRIPT_DIR/exports/isaac-lab-$profile.tar -C $SCRIPT_DIR/exports isaac-lab-$profile.sif
+        # wait for the target directory to be created on the cluster
+        if ! wait $remote_mkdir_pid; then
+            echo "[Error] Could not create the directory '$CLUSTER_SIF_PATH' on the remote host $CLUSTER_LOGIN!" >&2;
+            exit 1
+        fi
+        # send image to cluster (compressed on the wire, as the uncompressed archive is several GBs large)
+        # NOTE: partially transferred archives are kept in a separate directory so that an interrupted upload resumes
+        #   where it stopped, while jobs starting during the upload still read the previous complete archive
+        rsync -hz --partial-dir=.rsync-partial --progress -e "ssh $SSH_OPTS" $SCRIPT_DIR/exports/isaac-lab-$profile.tar $CLUSTER_LOGIN:$CLUSTER_SIF_PATH/isaac-lab-$profile.tar
         ;;
     job)
         [ $# -ge 1 ] && profile=$1 && shift
@@ -168,17 +217,19 @@ case $command in
         [ -n "$profile" ] && echo "Using profile: $profile"
         [ -n "$job_args" ] && echo "Job arguments: $job_args"
         source $SCRIPT_DIR/.env.cluster
+        # share a single SSH connection for all calls to the cluster
+        setup_ssh_connection
         # Get current date and time
         current_datetime=$(date +"%Y%m%d_%H%M%S")
         # Append current date and time to CLUSTER_ISAACLAB_DIR
         CLUSTER_ISAACLAB_DIR="${CLUSTER_ISAACLAB_DIR}_${current_datetime}"
-        # Check if singularity image exists on the remote host
-        check_singularity_image_exists isaac-lab-$profile
-        # make sure target directory exists
-        ssh $CLUSTER_LOGIN "mkdir -p $CLUSTER_ISAACLAB_DIR"
+        # Check if singularity image exists on the remote host and make sure target directory exists
+        check_singularity_image_exists isaac-lab-$profile $CLUSTER_ISAACLAB_DIR
         # Sync Isaac Lab code
         echo "[INFO] Syncing Isaac Lab code..."
-        rsync -rh  --exclude="*.git*" --filter=':- .dockerignore'  /$SCRIPT_DIR/../.. $CLUSTER_LOGIN:$CLUSTER_ISAACLAB_DIR
+        # NOTE: the target directory is freshly created for every job, so there is nothing to compute deltas against
+        #   and files can be written in place instead of through temporary copies
+        rsync -rhz --whole-file --inplace -e "ssh $SSH_OPTS" --exclude="*.git*" --filter=':- .dockerignore'  $SCRIPT_DIR/../.. $CLUSTER_LOGIN:$CLUSTER_ISAACLAB_DIR
         # execute job script
         echo "[INFO] Executing job script..."
         # check whether the second argument is a profile or a job argument
@@ -9,7 +9,8 @@ import argparse
 import shutil
 from pathlib import Path
 
-from utils import ContainerInterface, x11_utils
+# directory of the docker utilities, used as context for the docker compose commands
+CONTEXT_DIR = Path(__file__).resolve().parent
 
 
 def parse_cli_args() -> argparse.Namespace:
@@ -21,7 +22,10 @@ def parse_cli_args() -> argparse.Namespace:
     Returns:
         The parsed command line arguments.
     """
-    parser = argparse.ArgumentParser(description="Utility for using Docker with Isaac Lab.")
+    parser = argparse.ArgumentParser(
+        description="Utility for using Docker with Isaac Lab.",
+        epilog="Set the environment variable 'ISAACLAB_SKIP_X11=1' to bypass X11 forwarding on headless machines.",
+    )
 
     # We have to create separate parent parsers for common options to our subparsers
     parent_parser = argparse.ArgumentParser(add_help=False)
@@ -81,6 +85,10 @@ def parse_cli_args() -> argparse.Namespace:
 
 def main(args: argparse.Namespace):
     """Main function for the Docker utility."""
+    # note: the container utilities are imported here so that the argument parsing (e.g. for '--help')
+    #   does not have to load them
+    from utils import ContainerInterface, x11_utils
+
     # check if docker is installed
     if not shutil.which("docker"):
         raise RuntimeError(
@@ -89,9 +97,7 @@ def main(args: argparse.Namespace):
         )
 
     # creating container interface
-    ci = ContainerInterface(
-        context_dir=Path(__file__).resolve().parent, profile=args.profile, yamls=args.files, envs=args.env_files
-    )
+    ci = ContainerInterface(context_dir=CONTEXT_DIR, profile=args.profile, yamls=args.files, envs=args.env_files)
 
     print(f"[INFO] Using container profile: {ci.profile}")
     if args.command == "start":
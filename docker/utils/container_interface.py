@@ -6,8 +6,12 @@
 from __future__ import annotations
 
 import os
+import shlex
 import shutil
 import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
@@ -59,12 +63,43 @@ class ContainerInterface:
         self.image_name = f"isaac-lab-{self.profile}:latest"
 
         # keep the environment variables from the current environment
-        self.environ = os.environ
+        # note: we work on a copy so that updates for the docker compose calls (e.g. for X11 forwarding)
+        #   do not leak into the environment of the calling process
+        self.environ = os.environ.copy()
 
         # resolve the image extension through the passed yamls and envs
         self._resolve_image_extension(yamls, envs)
-        # load the environment variables from the .env files
-        self._parse_dot_vars()
+
+    """
+    Properties.
+    """
+
+    @cached_property
+    def dot_vars(self) -> dict[str, Any]:
+        """The environment variables parsed from the .env files.
+
+        Based on the passed ".env" files, the environment variables are read and stored in a dictionary. They are
+        read in order and overwritten if there are name conflicts, mimicking the behavior of Docker compose.
+
+        The files are only read on the first access, since most commands do not need the variables.
+
+        Raises:
+            RuntimeError: If the parameters for the env files are not configured as pairs.
+        """
+        dot_vars: dict[str, Any] = {}
+
+        # check if the number of arguments is even for the env files
+        if len(self.add_env_files) % 2 != 0:
+            raise RuntimeError(
+                "The parameters for env files are configured incorrectly. There should be an even number of arguments."
+                f" Received: {self.add_env_files}."
+            )
+
+        # read the environment variables from the .env files
+        for i in range(1, len(self.add_env_files), 2):
+            dot_vars.update(_read_dot_env_file(self.context_dir / self.add_env_files[i]))
+
+        return dot_vars
 
     """
     Operations.
@@ -76,13 +111,24 @@ class ContainerInterface:
         Returns:
             True if the container is running, otherwise False.
         """
-        status = subprocess.run(
-            ["docker", "container", "inspect", "-f", "{{.State.Status}}", self.container_name],
-            capture_output=True,
-            text=True,
+        # note: listing with filters prints the container ID only if it is running and, unlike inspecting the
+        #   container, does not fail when the container does not exist
+        container_id = subprocess.run(
+            [
+                "docker",
+                "container",
+                "ls",
+                "--quiet",
+                "--filter",
+                f"name=^{self.container_name}$",
+                "--filter",
+                "status=running",
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             check=False,
         ).stdout.strip()
-        return status == "running"
+        return container_id != b""
 
     def does_image_exist(self) -> bool:
         """Check if the Docker image exists.
@@ -90,7 +136,13 @@ class ContainerInterface:
         Returns:
             True if the image exists, otherwise False.
         """
-        result = subprocess.run(["docker", "image", "inspect", self.image_name], capture_output=True, text=True)
+        # note: only the return code is needed, so the output is discarded instead of captured
+        result = subprocess.run(
+            ["docker", "image", "inspect", self.image_name],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
         return result.returncode == 0
 
     def start(self):
@@ -101,29 +153,28 @@ class ContainerInterface:
         )
 
         # build the image for the base profile
-        subprocess.run(
-            [
-                "docker",
-                "compose",
-                "--file",
-                "docker-compose.yaml",
-                "--env-file",
-                ".env.base",
-                "build",
-                "isaac-lab-base",
-            ],
-            check=False,
-            cwd=self.context_dir,
-            env=self.environ,
-        )
+        # note: for the base profile, the image is already built by the 'up --build' call below. The other profiles
+        #   build on top of the base image but are not linked to it through compose, so it has to be built first.
+        if self.profile != "base":
+            subprocess.run(
+                [
+                    "docker",
+                    "compose",
+                    "--file",
+                    "docker-compose.yaml",
+                    "--env-file",
+                    ".env.base",
+                    "build",
+                    "isaac-lab-base",
+                ],
+                check=False,
+                cwd=self.context_dir,
+                env=self.environ,
+            )
 
         # build the image for the profile
         subprocess.run(
-            ["docker", "compose"]
-            + self.add_yamls
-            + self.add_profiles
-            + self.add_env_files
-            + ["up", "--detach", "--build", "--remove-orphans"],
+            self._compose_command("up", "--detach", "--build", "--remove-orphans"),
             check=False,
             cwd=self.context_dir,
             env=self.environ,
@@ -159,7 +210,7 @@ class ContainerInterface:
         if self.is_container_running():
             print(f"[INFO] Stopping the launched docker container '{self.container_name}'...\n")
             subprocess.run(
-                ["docker", "compose"] + self.add_yamls + self.add_profiles + self.add_env_files + ["down"],
+                self._compose_command("down"),
                 check=False,
                 cwd=self.context_dir,
                 env=self.environ,
@@ -175,7 +226,7 @@ class ContainerInterface:
                 the context directory is used.
 
         Raises:
-            RuntimeError: If the container is not running.
+            RuntimeError: If the container is not running or the artifacts could not be copied from it.
         """
         if self.is_container_running():
             print(f"[INFO] Copying artifacts from the '{self.container_name}' container...\n")
@@ -197,21 +248,70 @@ class ContainerInterface:
             # print the artifacts to be copied
             for container_path, host_path in artifacts.items():
                 print(f"\t -{container_path} -> {host_path}")
-            # remove the existing artifacts
-            for path in artifacts.values():
-                shutil.rmtree(path, ignore_errors=True)
-
-            # copy the artifacts
+            # create the archive of the artifacts inside the container
+            # note: all artifacts are streamed through a single tar archive instead of one 'docker cp' call per
+            #   artifact. The archive members are renamed to their host layout (e.g. 'docs/_build' -> 'docs').
+            archive_cmd = ["tar", "--create", "--file", "-"]
+            archive_members = []
             for container_path, host_path in artifacts.items():
-                subprocess.run(
-                    [
-                        "docker",
-                        "cp",
-                        f"isaac-lab-{self.profile}:{container_path}/",
-                        f"{host_path}",
-                    ],
-                    check=False,
-                )
+                member = container_path.relative_to(docker_isaac_lab_path).as_posix()
+                if member != host_path.name:
+                    archive_cmd += ["--transform", f"s,^{member},{host_path.name},"]
+                archive_members.append(member)
+            # only archive the artifacts that exist in the container (e.g. the docs may have never been built)
+            # note: the members are filtered within the container, so that tar fails on any other error. Passing an
+            #   empty file list keeps the archive valid if none of the artifacts exist.
+            archive_script = (
+                f"cd {shlex.quote(str(docker_isaac_lab_path))} || exit 2; n=$#;"
+                ' for m; do [ -e "$m" ] && set -- "$@" "$m"; done; shift $n;'
+                f' exec {shlex.join(archive_cmd)} --files-from /dev/null "$@"'
+            )
+
+            # copy the artifacts by extracting the archive into a staging directory on the host
+            # note: the existing artifacts are only replaced once the archive is fully extracted, so that they are
+            #   not lost if the copy is interrupted
+            staging_dir = Path(tempfile.mkdtemp(prefix=".copy-", dir=output_dir))
+            copied_dir, replaced_dir = staging_dir / "copied", staging_dir / "replaced"
+            copied_dir.mkdir()
+            replaced_dir.mkdir()
+            try:
+                with subprocess.Popen(
+                    ["docker", "exec", self.container_name, "sh", "-c", archive_script, "sh", *archive_members],
+                    stdout=subprocess.PIPE,
+                ) as archive, subprocess.Popen(
+                    ["tar", "-xf", "-", "--no-same-owner", "-C", str(copied_dir)], stdin=archive.stdout
+                ) as extraction:
+                    # close our end of the pipe so that the archive process stops if the extraction fails
+                    archive.stdout.close()
+
+                # keep the existing artifacts if the archive was not extracted completely
+                # note: tar exits with status 1 if files changed while they were archived (e.g. logs of a running
+                #   training). The archive is still complete, so this only results in a warning.
+                if extraction.returncode != 0 or archive.returncode not in (0, 1):
+                    raise RuntimeError(
+                        f"Failed to copy the artifacts from the container '{self.container_name}' (archive exit code:"
+                        f" {archive.returncode}, extraction exit code: {extraction.returncode}). The existing"
+                        f" artifacts in '{output_dir}' were kept."
+                    )
+                if archive.returncode == 1:
+                    print("[WARN] Some artifacts changed while they were copied from the container.")
+
+                # swap the copied artifacts into place
+                for host_path in artifacts.values():
+                    copied_path = copied_dir / host_path.name
+                    if not copied_path.is_dir():
+                        continue
+                    if host_path.exists():
+                        host_path.rename(replaced_dir / host_path.name)
+                    copied_path.rename(host_path)
+
+                # remove the replaced artifacts
+                # note: the removals are independent of each other, so they are run concurrently
+                with ThreadPoolExecutor(max_workers=len(artifacts)) as executor:
+                    for path in replaced_dir.iterdir():
+                        executor.submit(shutil.rmtree, path, ignore_errors=True)
+            finally:
+                shutil.rmtree(staging_dir, ignore_errors=True)
             print("\n[INFO] Finished copying the artifacts from the container.")
         else:
             raise RuntimeError(f"The container '{self.container_name}' is not running.")
@@ -236,7 +336,7 @@ class ContainerInterface:
 
         # run the docker compose config command to generate the configuration
         subprocess.run(
-            ["docker", "compose"] + self.add_yamls + self.add_profiles + self.add_env_files + ["config"] + output,
+            self._compose_command("config", *output),
             check=False,
             cwd=self.context_dir,
             env=self.environ,
@@ -274,23 +374,44 @@ class ContainerInterface:
             for yaml in yamls:
                 self.add_yamls += ["--file", yaml]
 
-    def _parse_dot_vars(self):
-        """Parse the environment variables from the .env files.
+    def _compose_command(self, *args: str) -> list[str]:
+        """Build the Docker compose command for the resolved yamls, profiles and environment files.
+
+        Note:
+            The command is assembled on each call as :attr:`add_yamls` and :attr:`add_env_files` may be extended
+            after the construction of the interface (e.g. with the X11 forwarding yaml).
 
-        Based on the passed ".env" files, this function reads the environment variables and stores them in a dictionary.
-        The environment variables are read in order and overwritten if there are name conflicts, mimicking the behavior
-        of Docker compose.
+        Args:
+            args: The compose sub-command and its arguments.
+
+        Returns:
+            The full command to pass to :func:`subprocess.run`.
         """
-        self.dot_vars: dict[str, Any] = {}
+        return ["docker", "compose", *self.add_yamls, *self.add_profiles, *self.add_env_files, *args]
 
-        # check if the number of arguments is even for the env files
-        if len(self.add_env_files) % 2 != 0:
-            raise RuntimeError(
-                "The parameters for env files are configured incorrectly. There should be an even number of arguments."
-                f" Received: {self.add_env_files}."
-            )
 
-        # read the environment variables from the .env files
-        for i in range(1, len(self.add_env_files), 2):
-            with open(self.context_dir / self.add_env_files[i]) as f:
-                self.dot_vars.update(dict(line.strip().split("=", 1) for line in f if "=" in line))
+def _read_dot_env_file(path: Path) -> dict[str, str]:
+    """Read the environment variables from a .env file.
+
+    Values enclosed in single or double quotes are unquoted.
+
+    Args:
+        path: The path to the .env file.
+
+    Returns:
+        A dictionary with the environment variables of the file.
+    """
+    dot_vars = {}
+    for line in path.read_text().splitlines():
+        line = line.strip()
+        # skip comments, as done by docker compose
+        if line.startswith("#"):
+            continue
+        key, sep, value = line.partition("=")
+        if sep:
+            value = value.strip()
+            # remove matching surrounding quotes, as done by docker compose
+            if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+                value = value[1:-1]
+            dot_vars[key.strip()] = value
+    return dot_vars
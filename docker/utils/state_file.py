@@ -6,6 +6,7 @@
 from __future__ import annotations
 
 import configparser
+import os
 from configparser import ConfigParser
 from pathlib import Path
 from typing import Any
@@ -40,9 +41,12 @@ class StateFile:
         """
         Save the loaded configuration to the initial file path upon deconstruction. This helps
         ensure that the configuration file is always up to date.
+
+        The file is only written if the configuration was modified since it was loaded or last saved.
         """
         # save the configuration file
-        self.save()
+        if self._is_modified:
+            self.save()
 
     """
     Operations.
@@ -64,16 +68,15 @@ class StateFile:
             configparser.Error: If no section is specified and the default section is None.
         """
         # resolve the section
-        if section is None:
-            if self.namespace is None:
-                raise configparser.Error("No section specified. Please specify a section or set StateFile.namespace.")
-            section = self.namespace
+        section = self._resolve_section(section)
 
         # create section if it does not exist
-        if section not in self.loaded_cfg.sections():
+        if not self.loaded_cfg.has_section(section):
             self.loaded_cfg.add_section(section)
         # set the variable
-        self.loaded_cfg.set(section, key, value)
+        if self.loaded_cfg.get(section, key, fallback=None) != value:
+            self.loaded_cfg.set(section, key, value)
+            self._is_modified = True
 
     def get_variable(self, key: str, section: str | None = None) -> Any:
         """Get a variable from the configuration object.
@@ -93,10 +96,7 @@ class StateFile:
             configparser.Error: If no section is specified and the default section is None.
         """
         # resolve the section
-        if section is None:
-            if self.namespace is None:
-                raise configparser.Error("No section specified. Please specify a section or set StateFile.namespace.")
-            section = self.namespace
+        section = self._resolve_section(section)
 
         return self.loaded_cfg.get(section, key, fallback=None)
 
@@ -117,18 +117,16 @@ class StateFile:
             configparser.NoOptionError: If the key does not exist in the section.
         """
         # resolve the section
-        if section is None:
-            if self.namespace is None:
-                raise configparser.Error("No section specified. Please specify a section or set StateFile.namespace.")
-            section = self.namespace
+        section = self._resolve_section(section)
 
         # check if the section exists
-        if section not in self.loaded_cfg.sections():
+        if not self.loaded_cfg.has_section(section):
             raise configparser.NoSectionError(f"Section '{section}' does not exist in the file: {self.path}")
 
         # check if the key exists
         if self.loaded_cfg.has_option(section, key):
             self.loaded_cfg.remove_option(section, key)
+            self._is_modified = True
         else:
             raise configparser.NoOptionError(option=key, section=section)
 
@@ -140,12 +138,44 @@ class StateFile:
         """Load the configuration file into memory.
 
         This function reads the contents of the configuration file into memory.
-        If the file does not exist, it creates an empty file.
+        If the file does not exist, an empty configuration is loaded. The file is created on the first save.
         """
         self.loaded_cfg = ConfigParser()
         self.loaded_cfg.read(self.path)
+        # the loaded configuration is in sync with the file
+        self._is_modified = False
 
     def save(self):
-        """Save the configuration file to disk."""
-        with open(self.path, "w+") as f:
+        """Save the configuration file to disk.
+
+        The configuration is first written to a temporary file next to the configuration file, which then
+        replaces it. This ensures that the file on disk is never left partially written.
+        """
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w") as f:
             self.loaded_cfg.write(f)
+        os.replace(tmp_path, self.path)
+        # the saved configuration is in sync with the file
+        self._is_modified = False
+
+    """
+    Helper functions.
+    """
+
+    def _resolve_section(self, section: str | None) -> str:
+        """Resolve the section to use for an operation.
+
+        Args:
+            section: The section passed to the operation. If None, the default section is used.
+
+        Returns:
+            The resolved section.
+
+        Raises:
+            configparser.Error: If no section is specified and the default section is None.
+        """
+        if section is None:
+            if self.namespace is None:
+                raise configparser.Error("No section specified. Please specify a section or set StateFile.namespace.")
+            section = self.namespace
+        return section
@@ -11,10 +11,14 @@ import os
 import shutil
 import subprocess
 import sys
+import tempfile
 from pathlib import Path
 
 from .state_file import StateFile
 
+# environment variable that bypasses all X11 handling (e.g. for headless or CI machines)
+SKIP_X11_ENVAR = "ISAACLAB_SKIP_X11"
+
 
 # This method of x11 enabling forwarding was inspired by osrf/rocker
 # https://github.com/osrf/rocker
@@ -50,7 +54,7 @@ def configure_x11(statefile: StateFile) -> dict[str, str]:
 
     if tmp_xauth_value is None or not Path(tmp_xauth_value).exists():
         # create a temporary directory to store the .xauth file
-        tmp_dir = subprocess.run(["mktemp", "-d"], capture_output=True, text=True, check=True).stdout.strip()
+        tmp_dir = tempfile.mkdtemp()
         # create the .xauth file
         tmp_xauth_value = create_x11_tmpfile(tmpdir=Path(tmp_dir))
         # set the statefile variable
@@ -78,7 +82,15 @@ def x11_check(statefile: StateFile) -> tuple[list[str], dict[str, str]] | None:
         - A dictionary containing the environment variables for the container.
 
         If X11 forwarding is disabled, the function returns None.
+
+    Note:
+        If the environment variable ``ISAACLAB_SKIP_X11`` is set to '1', the function returns None
+        without prompting the user or accessing the statefile.
     """
+    # skip X11 handling altogether (for instance, on headless machines)
+    if _is_x11_skipped():
+        return None
+
     # set the namespace to X11 for the statefile
     statefile.namespace = "X11"
     # check if X11 forwarding is enabled
@@ -125,10 +137,15 @@ def x11_cleanup(statefile: StateFile):
     """Clean up the temporary .xauth file used for X11 forwarding.
 
     If the .xauth file exists, this function deletes it and remove the corresponding state variable.
+    The function does nothing if the environment variable ``ISAACLAB_SKIP_X11`` is set to '1'.
 
     Args:
         statefile: An instance of the configuration file class.
     """
+    # skip X11 handling altogether (for instance, on headless machines)
+    if _is_x11_skipped():
+        return
+
     # set the namespace to X11 for the statefile
     statefile.namespace = "X11"
 
@@ -136,9 +153,14 @@ def x11_cleanup(statefile: StateFile):
     tmp_xauth_value = statefile.get_variable("__ISAACLAB_TMP_XAUTH")
 
     # if the file exists, delete it and remove the state variable
-    if tmp_xauth_value is not None and Path(tmp_xauth_value).exists():
-        print(f"[INFO] Removing temporary Isaac Lab '.xauth' file: {tmp_xauth_value}.")
-        Path(tmp_xauth_value).unlink()
+    # note: we attempt the removal directly instead of checking for existence first
+    #   to avoid an extra stat call on the file.
+    if tmp_xauth_value is not None:
+        try:
+            Path(tmp_xauth_value).unlink()
+        except FileNotFoundError:
+            return
+        print(f"[INFO] Removed temporary Isaac Lab '.xauth' file: {tmp_xauth_value}.")
         statefile.delete_variable("__ISAACLAB_TMP_XAUTH")
 
 
@@ -147,23 +169,17 @@ def create_x11_tmpfile(tmpfile: Path | None = None, tmpdir: Path | None = None)
 
     Args:
         tmpfile: A Path to a file which will be filled with the correct .xauth info.
-        tmpdir: A Path to the directory where a random tmp file will be made.
-            This is used as an ``--tmpdir arg`` to ``mktemp`` bash command.
+        tmpdir: A Path to the directory where a random tmp file will be made. Defaults to None, in which case
+            the default temporary directory of :mod:`tempfile` is used.
 
     Returns:
         The Path to the .xauth file.
     """
     if tmpfile is None:
-        if tmpdir is None:
-            add_tmpdir = ""
-        else:
-            add_tmpdir = f"--tmpdir={tmpdir}"
         # Create .tmp file with .xauth suffix
-        tmp_xauth = Path(
-            subprocess.run(
-                ["mktemp", "--suffix=.xauth", f"{add_tmpdir}"], capture_output=True, text=True, check=True
-            ).stdout.strip()
-        )
+        tmp_fd, tmp_path = tempfile.mkstemp(suffix=".xauth", dir=tmpdir)
+        os.close(tmp_fd)
+        tmp_xauth = Path(tmp_path)
     else:
         tmpfile.touch()
         tmp_xauth = tmpfile
@@ -183,6 +199,7 @@ def x11_refresh(statefile: StateFile):
     """Refresh the temporary .xauth file used for X11 forwarding.
 
     If x11 is enabled, this function generates a new .xauth file with the current MIT-MAGIC-COOKIE-1.
+    If x11 is disabled, the function returns early without calling ``xauth``.
     The new file uses the same filename so that the bind-mount and ``XAUTHORITY`` var from build-time
     still work.
 
@@ -193,35 +210,52 @@ def x11_refresh(statefile: StateFile):
     The function exits if X11 forwarding is enabled but the temporary .xauth file does not exist. In this case,
     the user must rebuild the container.
 
+    The function does nothing if the environment variable ``ISAACLAB_SKIP_X11`` is set to '1'.
+
     Args:
         statefile: An instance of the configuration file class.
     """
+    # skip X11 handling altogether (for instance, on headless machines)
+    if _is_x11_skipped():
+        return
+
     # set the namespace to X11 for the statefile
     statefile.namespace = "X11"
 
     # check if X11 forwarding is enabled
     is_x11_forwarding_enabled = statefile.get_variable("X11_FORWARDING_ENABLED")
-    # load the value of the temporary xauth file
-    tmp_xauth_value = statefile.get_variable("__ISAACLAB_TMP_XAUTH")
 
     # print the current configuration
     if is_x11_forwarding_enabled is not None:
         status = "enabled" if is_x11_forwarding_enabled == "1" else "disabled"
         print(f"[INFO] X11 Forwarding is {status} from the settings in '.container.cfg'")
 
+    # if X11 forwarding is disabled, there is no cookie to refresh
+    if is_x11_forwarding_enabled != "1":
+        print("[INFO] X11 forwarding is disabled. No action taken.")
+        return
+
+    # load the value of the temporary xauth file
+    tmp_xauth_value = statefile.get_variable("__ISAACLAB_TMP_XAUTH")
+
     # if the file exists, delete it and create a new one
-    if tmp_xauth_value is not None and Path(tmp_xauth_value).exists():
+    if tmp_xauth_value is not None:
         # remove the file and create a new one
-        Path(tmp_xauth_value).unlink()
+        try:
+            Path(tmp_xauth_value).unlink()
+        except FileNotFoundError:
+            return
         create_x11_tmpfile(tmpfile=Path(tmp_xauth_value))
         # update the statefile with the new path
         statefile.set_variable("__ISAACLAB_TMP_XAUTH", str(tmp_xauth_value))
-    elif tmp_xauth_value is None:
-        if is_x11_forwarding_enabled is not None and is_x11_forwarding_enabled == "1":
-            print(
-                "[ERROR] X11 forwarding is enabled but the temporary .xauth file does not exist."
-                " Please rebuild the container by running: './docker/container.py start'"
-            )
-            sys.exit(1)
-        else:
-            print("[INFO] X11 forwarding is disabled. No action taken.")
+    else:
+        print(
+            "[ERROR] X11 forwarding is enabled but the temporary .xauth file does not exist."
+            " Please rebuild the container by running: './docker/container.py start'"
+        )
+        sys.exit(1)
+
+
+def _is_x11_skipped() -> bool:
+    """Check whether X11 handling is bypassed through the ``ISAACLAB_SKIP_X11`` environment variable."""
+    return os.environ.get(SKIP_X11_ENVAR) == "1"
@@ -593,11 +593,9 @@ def quat_rotate(q: torch.Tensor, v: torch.Tensor) -> torch.Tensor:
     q_vec = q[..., 1:]
     a = v * (2.0 * q_w**2 - 1.0).unsqueeze(-1)
     b = torch.cross(q_vec, v, dim=-1) * q_w.unsqueeze(-1) * 2.0
-    # for two-dimensional tensors, bmm is faster than einsum
-    if q_vec.dim() == 2:
-        c = q_vec * torch.bmm(q_vec.view(q.shape[0], 1, 3), v.view(q.shape[0], 3, 1)).squeeze(-1) * 2.0
-    else:
-        c = q_vec * torch.einsum("...i,...i->...", q_vec, v).unsqueeze(-1) * 2.0
+    # note: an element-wise product and sum avoids the reshapes and the batched matmul dispatch
+    #   for a dot product of size 3, and works for any number of leading dimensions.
+    c = q_vec * (q_vec * v).sum(dim=-1, keepdim=True) * 2.0
     return a + b + c
 
 
@@ -616,11 +614,9 @@ def quat_rotate_inverse(q: torch.Tensor, v: torch.Tensor) -> torch.Tensor:
     q_vec = q[..., 1:]
     a = v * (2.0 * q_w**2 - 1.0).unsqueeze(-1)
     b = torch.cross(q_vec, v, dim=-1) * q_w.unsqueeze(-1) * 2.0
-    # for two-dimensional tensors, bmm is faster than einsum
-    if q_vec.dim() == 2:
-        c = q_vec * torch.bmm(q_vec.view(q.shape[0], 1, 3), v.view(q.shape[0], 3, 1)).squeeze(-1) * 2.0
-    else:
-        c = q_vec * torch.einsum("...i,...i->...", q_vec, v).unsqueeze(-1) * 2.0
+    # note: an element-wise product and sum avoids the reshapes and the batched matmul dispatch
+    #   for a dot product of size 3, and works for any number of leading dimensions.
+    c = q_vec * (q_vec * v).sum(dim=-1, keepdim=True) * 2.0
     return a - b + c
 
 
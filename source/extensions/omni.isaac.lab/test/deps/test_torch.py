@@ -17,7 +17,8 @@ class TestTorchOperations(unittest.TestCase):
         """Check that using ellipsis and slices work for torch tensors."""
 
         size = (400, 300, 5)
-        my_tensor = torch.rand(size, device="cuda:0")
+        # note: only the shapes are checked, so the tensor is not filled with data
+        my_tensor = torch.empty(size, device="cuda:0")
 
         self.assertEqual(my_tensor[..., 0].shape, (400, 300))
         self.assertEqual(my_tensor[:, :, 0].shape, (400, 300))
@@ -45,8 +46,7 @@ class TestTorchOperations(unittest.TestCase):
         my_tensor_1[:, 1:, :] = my_tensor_1[:, :-1, :]
         my_tensor_1[:, 0, :] = my_tensor[:, -1, :]
         # check that circular buffer works as expected
-        error = torch.max(torch.abs(my_tensor_1 - my_tensor.roll(1, dims=1)))
-        self.assertNotEqual(error.item(), 0.0)
+        self.assertFalse(torch.equal(my_tensor_1, my_tensor.roll(1, dims=1)))
         self.assertFalse(torch.allclose(my_tensor_1, my_tensor.roll(1, dims=1)))
 
         # roll up the tensor with cloning
@@ -54,8 +54,7 @@ class TestTorchOperations(unittest.TestCase):
         my_tensor_2[:, 1:, :] = my_tensor_2[:, :-1, :].clone()
         my_tensor_2[:, 0, :] = my_tensor[:, -1, :]
         # check that circular buffer works as expected
-        error = torch.max(torch.abs(my_tensor_2 - my_tensor.roll(1, dims=1)))
-        self.assertEqual(error.item(), 0.0)
+        self.assertTrue(torch.equal(my_tensor_2, my_tensor.roll(1, dims=1)))
         self.assertTrue(torch.allclose(my_tensor_2, my_tensor.roll(1, dims=1)))
 
         # roll up the tensor with detach operation
@@ -63,8 +62,7 @@ class TestTorchOperations(unittest.TestCase):
         my_tensor_3[:, 1:, :] = my_tensor_3[:, :-1, :].detach()
         my_tensor_3[:, 0, :] = my_tensor[:, -1, :]
         # check that circular buffer works as expected
-        error = torch.max(torch.abs(my_tensor_3 - my_tensor.roll(1, dims=1)))
-        self.assertNotEqual(error.item(), 0.0)
+        self.assertFalse(torch.equal(my_tensor_3, my_tensor.roll(1, dims=1)))
         self.assertFalse(torch.allclose(my_tensor_3, my_tensor.roll(1, dims=1)))
 
         # roll up the tensor with roll operation
@@ -72,10 +70,18 @@ class TestTorchOperations(unittest.TestCase):
         my_tensor_4 = my_tensor_4.roll(1, dims=1)
         my_tensor_4[:, 0, :] = my_tensor[:, -1, :]
         # check that circular buffer works as expected
-        error = torch.max(torch.abs(my_tensor_4 - my_tensor.roll(1, dims=1)))
-        self.assertEqual(error.item(), 0.0)
+        self.assertTrue(torch.equal(my_tensor_4, my_tensor.roll(1, dims=1)))
         self.assertTrue(torch.allclose(my_tensor_4, my_tensor.roll(1, dims=1)))
 
+        # roll up the tensor with roll operation and write back into the same buffer
+        # note: this keeps the buffer memory (like the slicing variants) while shifting with a single roll
+        my_tensor_5 = my_tensor.clone()
+        my_tensor_5.copy_(my_tensor_5.roll(1, dims=1))
+        my_tensor_5[:, 0, :] = my_tensor[:, -1, :]
+        # check that circular buffer works as expected
+        self.assertTrue(torch.equal(my_tensor_5, my_tensor.roll(1, dims=1)))
+        self.assertTrue(torch.allclose(my_tensor_5, my_tensor.roll(1, dims=1)))
+
     def test_array_circular_copy(self):
         """Check that circular buffer implementation in torch is copying data."""
 
@@ -97,7 +103,8 @@ class TestTorchOperations(unittest.TestCase):
         """Check multi-indexing works for torch tensors."""
 
         size = (400, 300, 5)
-        my_tensor = torch.rand(size, device="cuda:0")
+        # note: only the indexing is checked, so the tensor is not filled with data
+        my_tensor = torch.empty(size, device="cuda:0")
 
         # this fails since array indexing cannot be broadcasted!!
         with self.assertRaises(IndexError):
@@ -108,29 +115,32 @@ class TestTorchOperations(unittest.TestCase):
 
         size = (400, 300, 5)
         my_tensor = torch.rand(size, device="cuda:0")
+        # memory address of the underlying storage of the tensor
+        my_tensor_ptr = my_tensor.untyped_storage().data_ptr()
 
         # obtain a slice of the tensor
         my_slice = my_tensor[0, ...]
-        self.assertEqual(my_slice.untyped_storage().data_ptr(), my_tensor.untyped_storage().data_ptr())
+        self.assertEqual(my_slice.untyped_storage().data_ptr(), my_tensor_ptr)
 
         # obtain a slice over ranges
         my_slice = my_tensor[0:2, ...]
-        self.assertEqual(my_slice.untyped_storage().data_ptr(), my_tensor.untyped_storage().data_ptr())
+        self.assertEqual(my_slice.untyped_storage().data_ptr(), my_tensor_ptr)
 
         # obtain a slice over list
         my_slice = my_tensor[[0, 1], ...]
-        self.assertNotEqual(my_slice.untyped_storage().data_ptr(), my_tensor.untyped_storage().data_ptr())
+        self.assertNotEqual(my_slice.untyped_storage().data_ptr(), my_tensor_ptr)
 
         # obtain a slice over tensor
         my_slice = my_tensor[torch.tensor([0, 1]), ...]
-        self.assertNotEqual(my_slice.untyped_storage().data_ptr(), my_tensor.untyped_storage().data_ptr())
+        self.assertNotEqual(my_slice.untyped_storage().data_ptr(), my_tensor_ptr)
 
     def test_logical_or(self):
         """Test bitwise or operation."""
 
         size = (400, 300, 5)
-        my_tensor_1 = torch.rand(size, device="cuda:0") > 0.5
-        my_tensor_2 = torch.rand(size, device="cuda:0") < 0.5
+        # note: sampling the booleans directly avoids the intermediate float tensors of a thresholded rand
+        my_tensor_1 = torch.empty(size, dtype=torch.bool, device="cuda:0").bernoulli_(0.5)
+        my_tensor_2 = torch.empty(size, dtype=torch.bool, device="cuda:0").bernoulli_(0.5)
 
         # check the speed of logical or
         timer_logical_or = benchmark.Timer(
@@ -140,14 +150,48 @@ class TestTorchOperations(unittest.TestCase):
         timer_bitwise_or = benchmark.Timer(
             stmt="my_tensor_1 | my_tensor_2", globals={"my_tensor_1": my_tensor_1, "my_tensor_2": my_tensor_2}
         )
+        # flatten the booleans to check whether the number of dimensions affects the speed
+        my_flat_1 = my_tensor_1.view(-1)
+        my_flat_2 = my_tensor_2.view(-1)
+        timer_flat_or = benchmark.Timer(
+            stmt="my_flat_1 | my_flat_2", globals={"my_flat_1": my_flat_1, "my_flat_2": my_flat_2}
+        )
+        # reinterpret the booleans as 64-bit words so that each operation processes eight booleans at once
+        # note: this shares the memory of the boolean tensors and requires the number of elements to be a multiple of 8
+        self.assertEqual(my_tensor_1.numel() % 8, 0)
+        my_packed_1 = my_tensor_1.view(torch.uint8).view(-1).view(torch.int64)
+        my_packed_2 = my_tensor_2.view(torch.uint8).view(-1).view(torch.int64)
+        timer_packed_or = benchmark.Timer(
+            stmt="my_packed_1 | my_packed_2", globals={"my_packed_1": my_packed_1, "my_packed_2": my_packed_2}
+        )
+        # capture the bitwise or in a CUDA graph so that replays skip the kernel launch overhead
+        # note: the operation is warmed up on a side stream before the capture, as recommended by torch
+        side_stream = torch.cuda.Stream()
+        side_stream.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(side_stream):
+            my_tensor_1 | my_tensor_2
+        torch.cuda.current_stream().wait_stream(side_stream)
+        graph_bitwise_or = torch.cuda.CUDAGraph()
+        with torch.cuda.graph(graph_bitwise_or):
+            output_graph_or = my_tensor_1 | my_tensor_2
+        timer_graph_or = benchmark.Timer(stmt="graph.replay()", globals={"graph": graph_bitwise_or})
 
         print("Time for logical or:", timer_logical_or.timeit(number=1000))
         print("Time for bitwise or:", timer_bitwise_or.timeit(number=1000))
+        print("Time for flattened bitwise or:", timer_flat_or.timeit(number=1000))
+        print("Time for packed bitwise or:", timer_packed_or.timeit(number=1000))
+        print("Time for graph bitwise or:", timer_graph_or.timeit(number=1000))
         # check that logical or works as expected
         output_logical_or = torch.logical_or(my_tensor_1, my_tensor_2)
         output_bitwise_or = my_tensor_1 | my_tensor_2
+        output_flat_or = (my_flat_1 | my_flat_2).view(size)
+        output_packed_or = (my_packed_1 | my_packed_2).view(torch.bool).view(size)
+        graph_bitwise_or.replay()
 
         self.assertTrue(torch.allclose(output_logical_or, output_bitwise_or))
+        self.assertTrue(torch.equal(output_flat_or, output_bitwise_or))
+        self.assertTrue(torch.equal(output_packed_or, output_bitwise_or))
+        self.assertTrue(torch.equal(output_graph_or, output_bitwise_or))
 
 
 if __name__ == "__main__":
@@ -232,8 +232,8 @@ class TestMathUtilities(unittest.TestCase):
     def test_quat_rotate_and_quat_rotate_inverse(self):
         """Test for quat_rotate and quat_rotate_inverse methods.
 
-        The new implementation uses :meth:`torch.einsum` instead of `torch.bmm` which allows
-        for more flexibility in the input dimensions and is faster than `torch.bmm`.
+        The new implementation computes the dot product with an element-wise product and sum instead of
+        `torch.bmm`, which allows for more flexibility in the input dimensions and avoids the reshapes.
         """
 
         # define old implementation for quat_rotate and quat_rotate_inverse